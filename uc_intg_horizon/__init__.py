@@ -12,6 +12,7 @@ import asyncio
 import json
 import logging
 import os
+import signal
 import sys
 from pathlib import Path
 
@@ -35,21 +36,34 @@ try:
 except (FileNotFoundError, json.JSONDecodeError, KeyError):
     __version__ = "0.0.0"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s | %(name)-40s | %(levelname)-8s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-logging.getLogger("websockets.server").setLevel(logging.CRITICAL)
-logging.getLogger("lghorizon").setLevel(logging.INFO)
-
 _LOG = logging.getLogger(__name__)
 
+_BANNER = "=" * 70
+
+
+def _setup_logging() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(name)-40s | %(levelname)-8s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    # Debug records are opt-in; formatting them on every MQTT event is not free
+    level_name = os.environ.get("UC_LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelNamesMapping().get(level_name)
+    if level is None:
+        _LOG.warning("Unknown UC_LOG_LEVEL '%s', using INFO", level_name)
+        level = logging.INFO
+    # Not __name__: the PyInstaller build runs this file as __main__
+    logging.getLogger("uc_intg_horizon").setLevel(level)
+    logging.getLogger("websockets.server").setLevel(logging.CRITICAL)
+    logging.getLogger("lghorizon").setLevel(logging.INFO)
+
 
 async def main() -> None:
-    _LOG.info("=" * 70)
+    _setup_logging()
+    _LOG.info(_BANNER)
     _LOG.info("LG Horizon Integration v%s (ucapi-framework)", __version__)
-    _LOG.info("=" * 70)
+    _LOG.info(_BANNER)
 
     driver = HorizonDriver()
 
@@ -74,7 +88,19 @@ async def main() -> None:
     else:
         _LOG.info("No configured devices - waiting for setup")
 
-    await asyncio.Future()
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass
+
+    try:
+        await stop_event.wait()
+        _LOG.info("Shutdown requested")
+    finally:
+        await driver.shutdown()
 
 
 def run() -> None:
@@ -8,13 +8,19 @@ Constants for Horizon integration.
 CONNECT_RETRIES = 5
 CONNECT_RETRY_DELAY = 3
 PERIODIC_REFRESH_INTERVAL = 15
+IDLE_REFRESH_INTERVAL = 60
 POSITION_RESEND_THRESHOLD = 10
 CHANNEL_UPDATE_DELAY = 2.5
 POWER_COMMAND_DELAY = 3.0
 DIGIT_KEY_DELAY = 0.3
 DIGIT_ENTER_DELAY = 0.5
+KEY_PUSH_DELAY = 0.25
 WATCHDOG_INTERVAL = 60
 RECONNECT_DELAY = 10
+ENTITIES_READY_TIMEOUT = 30
+PUSH_COALESCE_DELAY = 0.05
+STATE_UPDATE_DELAY = 0.15
+TOKEN_SAVE_DELAY = 2.0
 
 PROVIDER_TO_COUNTRY = {
     "Ziggo": "nl",
@@ -63,7 +69,7 @@ SIMPLE_COMMANDS = [
     "RED", "GREEN", "YELLOW", "BLUE",
 ]
 
-STREAMING_APPS = [
+STREAMING_APPS = frozenset({
     "Netflix", "BBC iPlayer", "ITVX", "All 4", "My5",
     "Prime Video", "YouTube", "Disney+",
-]
+})
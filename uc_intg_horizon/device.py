@@ -8,9 +8,11 @@ Horizon device wrapper using lghorizon API with ucapi-framework.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import ssl
+import time
 from datetime import datetime
 from typing import Any
 
@@ -42,6 +44,29 @@ from uc_intg_horizon.const import (
 
 _LOG = logging.getLogger(__name__)
 
+_RUNNING_STATE_NAMES = {
+    LGHorizonRunningState.ONLINE_RUNNING: "ONLINE_RUNNING",
+    LGHorizonRunningState.ONLINE_STANDBY: "ONLINE_STANDBY",
+    LGHorizonRunningState.OFFLINE: "OFFLINE",
+}
+_IDLE_STATE_NAMES = {"ONLINE_STANDBY": "STANDBY", "OFFLINE": "OFF"}
+
+
+def _token_preview(token: str | None) -> str | None:
+    return token[:20] if token and len(token) > 20 else token
+
+
+@functools.lru_cache(maxsize=256)
+def _iso_to_epoch(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _to_epoch(value: Any) -> float:
+    # Programme bounds repeat on every refresh until the programme changes
+    if isinstance(value, (int, float)):
+        return float(value)
+    return _iso_to_epoch(str(value))
+
 
 class HorizonDevice(ExternalClientDevice):
     """Wrapper for lghorizon API using ucapi-framework ExternalClientDevice."""
@@ -61,8 +86,13 @@ class HorizonDevice(ExternalClientDevice):
         self._api: LGHorizonApi | None = None
         self._lg_devices: dict[str, LGDevice] = {}
         self._token_needs_save: bool = False
+        self._refresh_token: str | None = None
         self._channels_loaded: bool = False
+        self._channel_list: list[dict[str, str]] | None = None
         self._connect_lock: asyncio.Lock = asyncio.Lock()
+        self._connect_task: asyncio.Task | None = None
+        self._state_events: dict[str, asyncio.Event] = {}
+        self._command_locks: dict[str, asyncio.Lock] = {}
 
         os.environ["SSL_CERT_FILE"] = certifi.where()
         os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
@@ -101,6 +131,16 @@ class HorizonDevice(ExternalClientDevice):
     def token_needs_save(self) -> bool:
         return self._token_needs_save
 
+    @property
+    def refresh_token(self) -> str | None:
+        # Rotations arrive through _on_token_refreshed; only fall back to the
+        # auth object when the API has not reported one yet
+        if self._refresh_token:
+            return self._refresh_token
+        if self._auth:
+            return getattr(self._auth, "refresh_token", None)
+        return None
+
     @property
     def channels_loaded(self) -> bool:
         return self._channels_loaded
@@ -108,10 +148,10 @@ class HorizonDevice(ExternalClientDevice):
     def mark_token_saved(self) -> None:
         self._token_needs_save = False
 
-    def get_refreshed_token(self) -> str | None:
-        if self._auth:
-            return getattr(self._auth, "refresh_token", None)
-        return None
+    def state_changed_event(self, device_id: str) -> asyncio.Event:
+        # Set on every state callback for the STB; callers clear it before
+        # sending a command and wait on it instead of sleeping a fixed delay
+        return self._state_events.setdefault(device_id, asyncio.Event())
 
     # -- ExternalClientDevice interface ----------------------------------------
 
@@ -120,6 +160,17 @@ class HorizonDevice(ExternalClientDevice):
         # twice in quick succession (device-added + subscribe_events) while the
         # first attempt is still in flight, which would orphan a connected MQTT
         # client and leak its aiohttp session (uc-intg-vidaa v1.0.0 failure mode).
+        if self.check_client_connected():
+            return True
+        # Callers arriving mid-attempt share its outcome instead of queueing
+        # a second full retry cycle behind the lock
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.create_task(self._connect_locked())
+        return await asyncio.shield(self._connect_task)
+
+    async def _connect_locked(self) -> bool:
+        # ExternalClientDevice.connect() itself returns early once the client
+        # is connected, so a caller queued behind a successful attempt is a no-op
         async with self._connect_lock:
             return await super().connect()
 
@@ -135,15 +186,15 @@ class HorizonDevice(ExternalClientDevice):
             _LOG.debug("Tearing down previous client before creating a new one")
             await self.disconnect_client()
 
+        self._refresh_token = None
         ssl_context = ssl.create_default_context(cafile=certifi.where())
         connector = aiohttp.TCPConnector(ssl=ssl_context)
         self._session = aiohttp.ClientSession(connector=connector)
 
-        token = self._device_config.password
         _LOG.info(
             "Using refresh token auth for %s (token: %s...)",
             self._country_code.upper(),
-            token[:20] if token and len(token) > 20 else token,
+            _token_preview(self._device_config.password),
         )
         self._auth = LGHorizonAuth(
             websession=self._session,
@@ -216,7 +267,11 @@ class HorizonDevice(ExternalClientDevice):
 
         self._lg_devices = {}
         self._auth = None
+        # The rotation belonged to the torn-down session; the config now owns
+        # the token, and setup may have replaced it since
+        self._refresh_token = None
         self._channels_loaded = False
+        self._channel_list = None
 
     def check_client_connected(self) -> bool:
         return (
@@ -233,10 +288,11 @@ class HorizonDevice(ExternalClientDevice):
         if new_token and new_token != old_token:
             _LOG.info(
                 "Token refreshed by API (old: %s... new: %s...)",
-                old_token[:20] if old_token and len(old_token) > 20 else old_token,
-                new_token[:20] if len(new_token) > 20 else new_token,
+                _token_preview(old_token),
+                _token_preview(new_token),
             )
             self._device_config.password = new_token
+            self._refresh_token = new_token
             self._token_needs_save = True
 
     # -- Background tasks ------------------------------------------------------
@@ -245,6 +301,7 @@ class HorizonDevice(ExternalClientDevice):
         try:
             _LOG.debug("Background channel loading started...")
             await refresh_channels_func()
+            self._channel_list = None
             self._channels_loaded = True
             _LOG.info("Background channel loading completed")
         except Exception as err:
@@ -254,16 +311,15 @@ class HorizonDevice(ExternalClientDevice):
 
     async def _on_device_state_change(self, device_id: str) -> None:
         _LOG.debug("Device state changed: %s", device_id)
+        event = self._state_events.get(device_id)
+        if event:
+            event.set()
         state = self.get_device_state(device_id)
         horizon_state = state.get("state", "unavailable")
         if horizon_state == "ONLINE_RUNNING":
             uc_state = "PAUSED" if state.get("paused") else "PLAYING"
-        elif horizon_state == "ONLINE_STANDBY":
-            uc_state = "STANDBY"
-        elif horizon_state == "OFFLINE":
-            uc_state = "OFF"
         else:
-            uc_state = "UNAVAILABLE"
+            uc_state = _IDLE_STATE_NAMES.get(horizon_state, "UNAVAILABLE")
         self.events.emit(DeviceEvents.UPDATE, device_id, {"state": uc_state})
 
     # -- Device state ----------------------------------------------------------
@@ -312,15 +368,7 @@ class HorizonDevice(ExternalClientDevice):
 
     @staticmethod
     def _running_state_to_string(state: LGHorizonRunningState | None) -> str:
-        if state is None:
-            return "unavailable"
-        if state == LGHorizonRunningState.ONLINE_RUNNING:
-            return "ONLINE_RUNNING"
-        if state == LGHorizonRunningState.ONLINE_STANDBY:
-            return "ONLINE_STANDBY"
-        if state == LGHorizonRunningState.OFFLINE:
-            return "OFFLINE"
-        return "unavailable"
+        return _RUNNING_STATE_NAMES.get(state, "unavailable")
 
     # -- Commands --------------------------------------------------------------
 
@@ -456,12 +504,16 @@ class HorizonDevice(ExternalClientDevice):
             _LOG.error("Seek failed for %s: %s", device_id, err)
             return False
 
+    def _command_lock(self, device_id: str) -> asyncio.Lock:
+        return self._command_locks.setdefault(device_id, asyncio.Lock())
+
     async def send_key(self, device_id: str, key: str) -> bool:
         device = await self.get_device(device_id)
         if not device:
             return False
         try:
-            await device.send_key_to_box(key)
+            async with self._command_lock(device_id):
+                await device.send_key_to_box(key)
             return True
         except Exception as err:
             _LOG.error("Send key '%s' failed for %s: %s", key, device_id, err)
@@ -512,12 +564,15 @@ class HorizonDevice(ExternalClientDevice):
                 _LOG.error("Invalid channel number: %s", channel_number)
                 return False
 
-            for digit in channel_str:
-                await device.send_key_to_box(digit)
-                await asyncio.sleep(DIGIT_KEY_DELAY)
+            # Hold the STB for the whole sequence so no other key lands
+            # between the digits
+            async with self._command_lock(device_id):
+                for digit in channel_str:
+                    await device.send_key_to_box(digit)
+                    await asyncio.sleep(DIGIT_KEY_DELAY)
 
-            await asyncio.sleep(DIGIT_ENTER_DELAY)
-            await device.send_key_to_box("Enter")
+                await asyncio.sleep(DIGIT_ENTER_DELAY)
+                await device.send_key_to_box("Enter")
             return True
 
         except Exception as err:
@@ -525,11 +580,18 @@ class HorizonDevice(ExternalClientDevice):
             return False
 
     async def get_channels(self) -> list[dict[str, str]]:
+        if self._channel_list is not None:
+            return self._channel_list
         if not self._api:
             return []
         try:
             channels = await self._api.get_profile_channels()
-            return [{"id": ch.id, "name": ch.title} for ch in channels.values()]
+            channel_list = [{"id": ch.id, "name": ch.title} for ch in channels.values()]
+            # The lineup only changes on a channel refresh; every STB entity,
+            # select and browse request of the account shares one build of it
+            if self._channels_loaded:
+                self._channel_list = channel_list
+            return channel_list
         except Exception as err:
             _LOG.error("Failed to get channels: %s", err)
             return []
@@ -541,21 +603,14 @@ class HorizonDevice(ExternalClientDevice):
         start_time: Any, end_time: Any, position: int | None = None
     ) -> tuple[int, int]:
         try:
-            def _to_datetime(val: Any) -> datetime:
-                if isinstance(val, (int, float)):
-                    return datetime.fromtimestamp(val)
-                return datetime.fromisoformat(str(val))
-
             if start_time and end_time:
-                start_dt = _to_datetime(start_time)
-                end_dt = _to_datetime(end_time)
-                duration = int((end_dt - start_dt).total_seconds())
+                start = _to_epoch(start_time)
+                duration = int(_to_epoch(end_time) - start)
 
                 if position is not None:
                     return (int(position), duration)
 
-                now = datetime.now()
-                pos = max(0, min(int((now - start_dt).total_seconds()), duration))
+                pos = max(0, min(int(time.time() - start), duration))
                 return (pos, duration)
 
         except Exception:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any
 
 from ucapi import DeviceStates, Events
@@ -16,6 +17,12 @@ from ucapi_framework import BaseIntegrationDriver
 from ucapi_framework.device import DeviceEvents
 
 from uc_intg_horizon.config import HorizonConfig
+from uc_intg_horizon.const import (
+    ENTITIES_READY_TIMEOUT,
+    PUSH_COALESCE_DELAY,
+    STATE_UPDATE_DELAY,
+    TOKEN_SAVE_DELAY,
+)
 from uc_intg_horizon.device import HorizonDevice
 from uc_intg_horizon.media_player import HorizonMediaPlayer
 from uc_intg_horizon.remote import HorizonRemote
@@ -42,9 +49,20 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
         )
         self._media_players: dict[str, HorizonMediaPlayer] = {}
         self._remotes: dict[str, HorizonRemote] = {}
-        self._sensors: dict[str, list] = {}
+        self._sensors: dict[str, tuple] = {}
+        self._entities: dict[str, Any] = {}
         self._retry_task: asyncio.Task | None = None
+        self._retry_connecting = False
         self._stb_to_config: dict[str, str] = {}
+        self._stb_devices: dict[str, HorizonDevice] = {}
+        self._saved_tokens: dict[str, str] = {}
+        self._pending_token_saves: dict[str, tuple[HorizonDevice, str]] = {}
+        self._token_save_task: asyncio.Task | None = None
+        self._token_flush_now = asyncio.Event()
+        self._entities_ready = asyncio.Event()
+        self._pending_pushes: set[str] = set()
+        self._push_task: asyncio.Task | None = None
+        self._pending_updates: dict[str, asyncio.Task] = {}
 
         self.api.add_listener(Events.SUBSCRIBE_ENTITIES, self._on_subscribe_entities)
 
@@ -73,44 +91,76 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
     def register_available_entities(
         self, device_config: HorizonConfig, device: HorizonDevice
     ) -> None:
+        identifier = device_config.identifier
         _LOG.info(
             "Registering entities for %s (%d STBs)",
-            device_config.identifier, len(device_config.devices),
+            identifier, len(device_config.devices),
         )
 
-        device.events.on(DeviceEvents.UPDATE, self._on_device_state_change)
+        if not any(known is device for known in self._stb_devices.values()):
+            device.events.on(DeviceEvents.UPDATE, self._on_device_state_change)
+        # Seed with the token loaded from disk once; a re-registered copy may
+        # carry a rotated token that has not been written yet
+        self._saved_tokens.setdefault(identifier, device_config.password)
+
+        # Re-registration only touches STBs that were added, dropped or moved
+        # to a new device instance; unchanged ones keep their entities
+        wanted = {dev_cfg.device_id for dev_cfg in device_config.devices}
+        for stb_id, config_id in list(self._stb_to_config.items()):
+            if config_id == identifier and stb_id not in wanted:
+                self._remove_stb_entities(stb_id)
 
+        new_entities: list[Any] = []
         for dev_cfg in device_config.devices:
             device_id = dev_cfg.device_id
             device_name = dev_cfg.name
-            self._stb_to_config[device_id] = device_config.identifier
+            if self._stb_devices.get(device_id) is device:
+                continue
+            self._remove_stb_entities(device_id)
+            self._stb_to_config[device_id] = identifier
+            self._stb_devices[device_id] = device
 
-            sensors = [
+            sensors = (
                 HorizonDeviceStateSensor(device_id, device_name, device, self.api),
                 HorizonChannelSensor(device_id, device_name, device, self.api),
                 HorizonProgramSensor(device_id, device_name, device, self.api),
-            ]
+            )
             self._sensors[device_id] = sensors
 
             mp = HorizonMediaPlayer(device_id, device_name, device, self.api, sensors)
             self._media_players[device_id] = mp
-            self.api.available_entities.add(mp)
 
             remote = HorizonRemote(device_id, device_name, device, self.api, mp)
             self._remotes[device_id] = remote
-            self.api.available_entities.add(remote)
-
-            for sensor in sensors:
-                self.api.available_entities.add(sensor)
 
+            new_entities.extend((mp, remote, *sensors))
             _LOG.info("Created entities for STB: %s (%s)", device_name, device_id)
 
+        for entity in new_entities:
+            self._entities[entity.id] = entity
+            self.api.available_entities.add(entity)
+
+    async def register_all_configured_devices(self, *args: Any, **kwargs: Any) -> None:
+        await super().register_all_configured_devices(*args, **kwargs)
+        self._entities_ready.set()
+
+    async def on_device_connected(self, device_id: str) -> None:
+        await super().on_device_connected(device_id)
+        # Reconnects triggered by the Remote call device.connect() directly,
+        # so a retry may still be sleeping once every account is back
+        if all(device.is_connected for device in self._device_instances.values()):
+            self._cancel_retry_task()
+
     def on_device_removed(self, device_or_config: HorizonDevice | HorizonConfig | None) -> None:
         if device_or_config is None:
+            for entity in (*self._media_players.values(), *self._remotes.values()):
+                entity.close()
             self._media_players.clear()
             self._remotes.clear()
             self._sensors.clear()
             self._stb_to_config.clear()
+            self._stb_devices.clear()
+            self._entities.clear()
             self.api.available_entities.clear()
             return
 
@@ -121,41 +171,67 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
         )
 
         for dev_cfg in config.devices:
-            device_id = dev_cfg.device_id
-            self._stb_to_config.pop(device_id, None)
+            self._remove_stb_entities(dev_cfg.device_id)
 
-            for store, attr in [
-                (self._media_players, "id"),
-                (self._remotes, "id"),
-            ]:
-                entity = store.pop(device_id, None)
-                if entity:
-                    self.api.available_entities.remove(getattr(entity, attr))
+    def _remove_stb_entities(self, device_id: str) -> None:
+        self._stb_to_config.pop(device_id, None)
+        self._stb_devices.pop(device_id, None)
 
-            if device_id in self._sensors:
-                for sensor in self._sensors.pop(device_id):
-                    self.api.available_entities.remove(sensor.id)
+        for store in (self._media_players, self._remotes):
+            entity = store.pop(device_id, None)
+            if entity:
+                entity.close()
+                self._entities.pop(entity.id, None)
+                self.api.available_entities.remove(entity.id)
+
+        for sensor in self._sensors.pop(device_id, ()):
+            self._entities.pop(sensor.id, None)
+            self.api.available_entities.remove(sensor.id)
 
     async def _on_subscribe_entities(self, entity_ids: list[str]) -> None:
+        # The Remote can subscribe as soon as the API is up, before the
+        # configured devices have registered their entities
+        if not self._entities_ready.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._entities_ready.wait(), timeout=ENTITIES_READY_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOG.error(
+                    "Entities not ready after %ds, subscribing what exists",
+                    ENTITIES_READY_TIMEOUT,
+                )
+
         for entity_id in entity_ids:
             entity = self._find_entity(entity_id)
             if entity:
                 self.api.configured_entities.add(entity)
                 if hasattr(entity, "push_update"):
-                    await entity.push_update(force=True)
+                    self._schedule_push(entity.id)
+
+    def _schedule_push(self, entity_id: str) -> None:
+        # Reconnect storms re-subscribe the same entities several times per
+        # second; collect them and push each one once per window
+        self._pending_pushes.add(entity_id)
+        if self._push_task is None or self._push_task.done():
+            self._push_task = asyncio.create_task(self._flush_pushes())
+
+    async def _flush_pushes(self) -> None:
+        while self._pending_pushes:
+            await asyncio.sleep(PUSH_COALESCE_DELAY)
+            pending, self._pending_pushes = self._pending_pushes, set()
+            entities = [e for e in map(self._find_entity, pending) if e is not None]
+
+            results = await asyncio.gather(
+                *(entity.push_update(force=True) for entity in entities),
+                return_exceptions=True,
+            )
+            for entity, result in zip(entities, results):
+                if isinstance(result, Exception):
+                    _LOG.error("Initial update failed for %s: %s", entity.id, result)
 
     def _find_entity(self, entity_id: str) -> Any | None:
-        for store in (self._media_players, self._remotes):
-            for entity in store.values():
-                if entity.id == entity_id:
-                    return entity
-
-        for sensors in self._sensors.values():
-            for sensor in sensors:
-                if sensor.id == entity_id:
-                    return sensor
-
-        return None
+        return self._entities.get(entity_id)
 
     async def on_device_update(
         self,
@@ -174,22 +250,58 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
         if not device_id:
             return
 
-        config_id = self._stb_to_config.get(device_id)
-        if config_id:
-            device = self._device_instances.get(config_id)
-            config = self.config_manager.get(config_id) if self.config_manager else None
-            if device and config and device.token_needs_save:
+        device = self._stb_devices.get(device_id)
+        if device and device.token_needs_save and self.config_manager:
+            config = self.config_manager.get(self._stb_to_config[device_id])
+            if config:
                 self._save_token_if_changed(device, config)
 
-        if device_id in self._media_players:
-            mp = self._media_players[device_id]
-            if self.api.configured_entities.contains(mp.id):
-                await mp.push_update()
+        if not self._has_subscribers(device_id):
+            return
 
-        if device_id in self._remotes:
-            remote = self._remotes[device_id]
-            if self.api.configured_entities.contains(remote.id):
-                await remote.push_update()
+        # Channel surfing fires a burst of callbacks per STB; the push reads
+        # the latest device state, so one push per burst is enough
+        if device_id not in self._pending_updates:
+            self._pending_updates[device_id] = asyncio.create_task(
+                self._flush_device_update(device_id)
+            )
+
+    async def _flush_device_update(self, device_id: str) -> None:
+        try:
+            await asyncio.sleep(STATE_UPDATE_DELAY)
+        finally:
+            self._pending_updates.pop(device_id, None)
+
+        contains = self.api.configured_entities.contains
+        pending = []
+        mp = self._media_players.get(device_id)
+        if mp and contains(mp.id):
+            pending.append(mp.push_update())
+        else:
+            # Sensors are normally fed by the media player's push; without a
+            # subscribed media player they have to be updated directly
+            pending.extend(
+                sensor.push_update()
+                for sensor in self._sensors.get(device_id, ())
+                if contains(sensor.id)
+            )
+
+        remote = self._remotes.get(device_id)
+        if remote and contains(remote.id):
+            pending.append(remote.push_update())
+
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                _LOG.error("State update failed for %s: %s", device_id, result)
+
+    def _has_subscribers(self, device_id: str) -> bool:
+        contains = self.api.configured_entities.contains
+        entities = (
+            self._media_players.get(device_id),
+            self._remotes.get(device_id),
+            *self._sensors.get(device_id, ()),
+        )
+        return any(e is not None and contains(e.id) for e in entities)
 
     async def connect_devices(self) -> bool:
         if not self.config_manager:
@@ -200,15 +312,12 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
             await self.api.set_device_state(DeviceStates.DISCONNECTED)
             return True
 
-        success = True
-        for config in configs:
-            device = self._device_instances.get(config.identifier)
-            if device and not device.is_connected:
-                if not await device.connect():
-                    _LOG.error("Failed to connect: %s", config.identifier)
-                    success = False
-                else:
-                    self._save_token_if_changed(device, config)
+        # Accounts are independent logins; overlap their handshakes
+        results = await asyncio.gather(
+            *(self._connect_config(config) for config in configs),
+            return_exceptions=True,
+        )
+        success = all(result is True for result in results)
 
         if success and self._media_players:
             await self.api.set_device_state(DeviceStates.CONNECTED)
@@ -218,31 +327,131 @@ class HorizonDriver(BaseIntegrationDriver[HorizonDevice, HorizonConfig]):
 
         return success
 
+    async def _connect_config(self, config: HorizonConfig) -> bool:
+        device = self._device_instances.get(config.identifier)
+        if not device or device.is_connected:
+            return True
+        try:
+            connected = await device.connect()
+        except Exception as err:
+            _LOG.error("Failed to connect %s: %s", config.identifier, err)
+            return False
+        if not connected:
+            _LOG.error("Failed to connect: %s", config.identifier)
+            return False
+        self._save_token_if_changed(device, config)
+        return True
+
     def _save_token_if_changed(self, device: HorizonDevice, config: HorizonConfig) -> None:
-        refreshed_token = device.get_refreshed_token()
-        if refreshed_token and refreshed_token != config.password:
-            config.password = refreshed_token
-            self.config_manager.update(config)
-            device.mark_token_saved()
-            _LOG.info("Token refreshed and saved for %s", config.identifier)
-        elif device.token_needs_save:
-            self.config_manager.update(config)
+        refreshed_token = device.refresh_token
+        token_changed = bool(refreshed_token) and refreshed_token != config.password
+        if not token_changed and not device.token_needs_save:
+            return
+
+        if not refreshed_token or self._saved_tokens.get(config.identifier) == refreshed_token:
             device.mark_token_saved()
+            return
+
+        # Token rotations tend to arrive in bursts (connect + first state
+        # callbacks); collect them and write the config once per window.
+        # No config copy is queued: the config and the token are read fresh
+        # at flush time so a stale snapshot never overwrites newer state
+        self._pending_token_saves[config.identifier] = (device, refreshed_token)
+        if self._token_save_task is None or self._token_save_task.done():
+            self._token_save_task = asyncio.create_task(self._delayed_token_save())
+
+    async def _delayed_token_save(self) -> None:
+        while self._pending_token_saves and not self._token_flush_now.is_set():
+            try:
+                await asyncio.wait_for(self._token_flush_now.wait(), timeout=TOKEN_SAVE_DELAY)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_token_saves()
+
+    async def flush_token_saves(self) -> None:
+        # Entries leave the queue only once handled, so an interrupted flush
+        # leaves the unwritten accounts queued
+        for identifier, entry in list(self._pending_token_saves.items()):
+            device = entry[0]
+            token = device.refresh_token
+            config = self.config_manager.get(identifier)
+            if not config or not token:
+                # Account was removed (or the client reset) while queued
+                self._pending_token_saves.pop(identifier, None)
+                continue
+            if self._saved_tokens.get(identifier) != token:
+                config.password = token
+                # The config manager is not thread-safe and the setup flow
+                # writes on the loop too, so keep this small write here; a
+                # failed write is reported by returning False
+                try:
+                    saved = self.config_manager.update(config)
+                except Exception as err:
+                    _LOG.error("Failed to save refreshed token for %s: %s", identifier, err)
+                    continue
+                if not saved:
+                    _LOG.error("Failed to save refreshed token for %s, will retry", identifier)
+                    continue
+                self._saved_tokens[identifier] = token
+                _LOG.info("Token refreshed and saved for %s", identifier)
+            # A rotation that arrived during the write stays queued
+            if self._pending_token_saves.get(identifier) is entry and device.refresh_token == token:
+                del self._pending_token_saves[identifier]
+                device.mark_token_saved()
+
+    async def shutdown(self) -> None:
+        for task in (
+            self._retry_task,
+            self._push_task,
+            *self._pending_updates.values(),
+        ):
+            if task and not task.done():
+                task.cancel()
+
+        # A rotated refresh token that never reaches disk locks the account out.
+        # Cancelling a queued save would drop the rest of its batch, so cut
+        # its wait short and let it finish
+        self._token_flush_now.set()
+        if self._token_save_task and not self._token_save_task.done():
+            await self._token_save_task
+        await self.flush_token_saves()
+
+        devices = list(self._device_instances.values())
+        results = await asyncio.gather(
+            *(device.disconnect() for device in devices), return_exceptions=True
+        )
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOG.debug("Error disconnecting %s: %s", device.identifier, result)
 
     def _start_retry_task(self) -> None:
         if self._retry_task is None or self._retry_task.done():
             self._retry_task = asyncio.create_task(self._retry_connection())
 
+    def _cancel_retry_task(self) -> None:
+        # Only a sleeping retry is cancelled; one that is already connecting
+        # finishes (and stops) on its own
+        task = self._retry_task
+        if task and not task.done() and not self._retry_connecting:
+            task.cancel()
+            self._retry_task = None
+
     async def _retry_connection(self) -> None:
         attempt = 0
+        max_index = len(_RETRY_DELAYS) - 1
         while self.config_manager and list(self.config_manager.all()):
-            delay = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS) - 1)]
-            _LOG.warning("Retrying connection in %ds (attempt #%d)...", delay, attempt + 1)
+            # Jitter keeps accounts that dropped together from retrying in lockstep
+            base = _RETRY_DELAYS[min(attempt, max_index)]
+            delay = base + random.uniform(0, base * 0.2)
+            _LOG.warning("Retrying connection in %.1fs (attempt #%d)...", delay, attempt + 1)
             await asyncio.sleep(delay)
+            self._retry_connecting = True
             try:
                 if await self.connect_devices():
                     _LOG.info("Retry successful!")
                     return
             except Exception as err:
                 _LOG.error("Retry failed: %s", err)
+            finally:
+                self._retry_connecting = False
             attempt += 1
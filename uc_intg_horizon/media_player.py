@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
 from typing import Any, TYPE_CHECKING
 
@@ -40,6 +41,35 @@ _LOG = logging.getLogger(__name__)
 
 _UNSET = object()
 
+# Commands that map 1:1 onto a remote key press
+_KEY_COMMANDS = {
+    Commands.VOLUME_UP: "VolumeUp",
+    Commands.VOLUME_DOWN: "VolumeDown",
+    Commands.CURSOR_UP: "ArrowUp",
+    Commands.CURSOR_DOWN: "ArrowDown",
+    Commands.CURSOR_LEFT: "ArrowLeft",
+    Commands.CURSOR_RIGHT: "ArrowRight",
+    Commands.CURSOR_ENTER: "Enter",
+    Commands.HOME: "MediaTopMenu",
+    Commands.MENU: "Info",
+    Commands.CONTEXT_MENU: "Options",
+    Commands.GUIDE: "Guide",
+    Commands.INFO: "Info",
+    Commands.BACK: "Escape",
+    "my_recordings": "Recordings",
+}
+
+# Commands that map onto a HorizonDevice method: (method name, changes channel)
+_DEVICE_COMMANDS = {
+    Commands.NEXT: ("next_channel", True),
+    Commands.PREVIOUS: ("previous_channel", True),
+    Commands.CHANNEL_UP: ("next_channel", True),
+    Commands.CHANNEL_DOWN: ("previous_channel", True),
+    Commands.FAST_FORWARD: ("fast_forward", False),
+    Commands.REWIND: ("rewind", False),
+    Commands.RECORD: ("record", False),
+}
+
 FEATURES = [
     Features.ON_OFF,
     Features.TOGGLE,
@@ -80,13 +110,16 @@ class HorizonMediaPlayer(MediaPlayer):
         device_name: str,
         horizon_device: HorizonDevice,
         api: ucapi.IntegrationAPI,
-        sensors: list | None = None,
+        sensors: tuple | None = None,
     ) -> None:
         self._device_id = device_id
         self._horizon_device = horizon_device
         self._api = api
-        self._sensors = sensors or []
+        self._sensors = sensors or ()
         self._channel_update_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._refresh_wake = asyncio.Event()
+        self._polling_position = False
         self._last_good_metadata: dict[str, Any] = {}
         self._pending_channel: str = ""
         self._last_sent_attributes: dict[str, Any] = {}
@@ -114,8 +147,18 @@ class HorizonMediaPlayer(MediaPlayer):
         )
 
         self._sources_loaded = False
-        asyncio.create_task(self._load_sources())
-        asyncio.create_task(self._periodic_refresh())
+        self._start_task(self._load_sources())
+        self._start_task(self._periodic_refresh())
+
+    def _start_task(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def close(self) -> None:
+        for task in (*self._tasks, self._channel_update_task):
+            if task and not task.done():
+                task.cancel()
 
     async def _load_sources(self) -> None:
         try:
@@ -130,16 +173,27 @@ class HorizonMediaPlayer(MediaPlayer):
             _LOG.error("Failed to load sources: %s", err)
 
     async def _periodic_refresh(self) -> None:
-        from uc_intg_horizon.const import PERIODIC_REFRESH_INTERVAL
-        await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
+        from uc_intg_horizon.const import IDLE_REFRESH_INTERVAL, PERIODIC_REFRESH_INTERVAL
+        # Entities are created back to back; spread their ticks over the interval
+        await asyncio.sleep(random.uniform(0, PERIODIC_REFRESH_INTERVAL))
 
         while True:
             try:
-                if self._api and self._api.configured_entities.contains(self.id):
-                    await self.push_update()
-                await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
+                # push_update() returns early for unsubscribed entities
+                await self.push_update()
+                # Only the playback position needs polling; state changes
+                # arrive as device callbacks
+                if self._polling_position:
+                    delay = PERIODIC_REFRESH_INTERVAL
+                else:
+                    delay = IDLE_REFRESH_INTERVAL
+                try:
+                    await asyncio.wait_for(self._refresh_wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._refresh_wake.clear()
             except asyncio.CancelledError:
-                break
+                raise
             except Exception as err:
                 _LOG.error("Periodic refresh error for %s: %s", self._device_id, err)
                 await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
@@ -157,9 +211,20 @@ class HorizonMediaPlayer(MediaPlayer):
 
         is_power = False
         is_channel = False
+        state_changed = self._horizon_device.state_changed_event(self._device_id)
+        state_changed.clear()
 
         try:
-            if cmd_id == Commands.ON:
+            key = _KEY_COMMANDS.get(cmd_id)
+            action = _DEVICE_COMMANDS.get(cmd_id)
+            if key:
+                await self._horizon_device.send_key(self._device_id, key)
+
+            elif action:
+                method, is_channel = action
+                await getattr(self._horizon_device, method)(self._device_id)
+
+            elif cmd_id == Commands.ON:
                 await self._horizon_device.power_on(self._device_id)
                 self.attributes[Attributes.STATE] = States.ON
                 is_power = True
@@ -191,23 +256,6 @@ class HorizonMediaPlayer(MediaPlayer):
                 await self._horizon_device.stop(self._device_id)
                 self.attributes[Attributes.STATE] = States.ON
 
-            elif cmd_id == Commands.NEXT:
-                await self._horizon_device.next_channel(self._device_id)
-                is_channel = True
-
-            elif cmd_id == Commands.PREVIOUS:
-                await self._horizon_device.previous_channel(self._device_id)
-                is_channel = True
-
-            elif cmd_id == Commands.FAST_FORWARD:
-                await self._horizon_device.fast_forward(self._device_id)
-
-            elif cmd_id == Commands.REWIND:
-                await self._horizon_device.rewind(self._device_id)
-
-            elif cmd_id == Commands.RECORD:
-                await self._horizon_device.record(self._device_id)
-
             elif cmd_id == Commands.SEEK:
                 if params and "media_position" in params:
                     position = int(params["media_position"])
@@ -217,58 +265,18 @@ class HorizonMediaPlayer(MediaPlayer):
                     return StatusCodes.OK if success else StatusCodes.SERVER_ERROR
                 return StatusCodes.BAD_REQUEST
 
-            elif cmd_id == Commands.VOLUME_UP:
-                await self._horizon_device.send_key(self._device_id, "VolumeUp")
-
-            elif cmd_id == Commands.VOLUME_DOWN:
-                await self._horizon_device.send_key(self._device_id, "VolumeDown")
-
             elif cmd_id == Commands.MUTE_TOGGLE:
                 await self._horizon_device.send_key(self._device_id, "VolumeMute")
                 self.attributes[Attributes.MUTED] = not self.attributes.get(
                     Attributes.MUTED, False
                 )
 
-            elif cmd_id == Commands.CURSOR_UP:
-                await self._horizon_device.send_key(self._device_id, "ArrowUp")
-            elif cmd_id == Commands.CURSOR_DOWN:
-                await self._horizon_device.send_key(self._device_id, "ArrowDown")
-            elif cmd_id == Commands.CURSOR_LEFT:
-                await self._horizon_device.send_key(self._device_id, "ArrowLeft")
-            elif cmd_id == Commands.CURSOR_RIGHT:
-                await self._horizon_device.send_key(self._device_id, "ArrowRight")
-            elif cmd_id == Commands.CURSOR_ENTER:
-                await self._horizon_device.send_key(self._device_id, "Enter")
-
-            elif cmd_id == Commands.HOME:
-                await self._horizon_device.send_key(self._device_id, "MediaTopMenu")
-            elif cmd_id == Commands.MENU:
-                await self._horizon_device.send_key(self._device_id, "Info")
-            elif cmd_id == Commands.CONTEXT_MENU:
-                await self._horizon_device.send_key(self._device_id, "Options")
-            elif cmd_id == Commands.GUIDE:
-                await self._horizon_device.send_key(self._device_id, "Guide")
-            elif cmd_id == Commands.INFO:
-                await self._horizon_device.send_key(self._device_id, "Info")
-            elif cmd_id == Commands.BACK:
-                await self._horizon_device.send_key(self._device_id, "Escape")
-
-            elif cmd_id == Commands.CHANNEL_UP:
-                await self._horizon_device.next_channel(self._device_id)
-                is_channel = True
-            elif cmd_id == Commands.CHANNEL_DOWN:
-                await self._horizon_device.previous_channel(self._device_id)
-                is_channel = True
-
             elif cmd_id == Commands.SELECT_SOURCE:
                 return await self._handle_select_source(params)
 
             elif cmd_id == Commands.PLAY_MEDIA:
                 return await self._handle_play_media(params)
 
-            elif cmd_id == "my_recordings":
-                await self._horizon_device.send_key(self._device_id, "Recordings")
-
             elif cmd_id.startswith("channel_select:"):
                 channel = cmd_id.split(":", 1)[1]
                 await self._horizon_device.set_channel_by_number(self._device_id, channel)
@@ -279,7 +287,11 @@ class HorizonMediaPlayer(MediaPlayer):
                 return StatusCodes.NOT_IMPLEMENTED
 
             if is_power:
-                await asyncio.sleep(POWER_COMMAND_DELAY)
+                # Push as soon as the box reports back; the delay is a ceiling
+                try:
+                    await asyncio.wait_for(state_changed.wait(), timeout=POWER_COMMAND_DELAY)
+                except asyncio.TimeoutError:
+                    pass
                 await self.push_update()
             elif is_channel:
                 self._schedule_channel_update()
@@ -287,7 +299,10 @@ class HorizonMediaPlayer(MediaPlayer):
             return StatusCodes.OK
 
         except Exception as err:
-            _LOG.error("[%s] Command error: %s", self.id, err, exc_info=True)
+            _LOG.error(
+                "[%s] Command error: %s", self.id, err,
+                exc_info=_LOG.isEnabledFor(logging.DEBUG),
+            )
             return StatusCodes.SERVER_ERROR
 
     async def _handle_select_source(self, params: dict[str, Any] | None) -> StatusCodes:
@@ -391,7 +406,7 @@ class HorizonMediaPlayer(MediaPlayer):
         if base_url != self._image_base_url:
             sep = "&" if "?" in base_url else "?"
             self._image_base_url = base_url
-            self._image_unique_url = f"{base_url}{sep}_t={int(time.time() * 1000)}"
+            self._image_unique_url = f"{base_url}{sep}_t={time.time_ns() // 1_000_000}"
         return self._image_unique_url
 
     # -- Push update -----------------------------------------------------------
@@ -400,49 +415,48 @@ class HorizonMediaPlayer(MediaPlayer):
         if not self._api or not self._api.configured_entities.contains(self.id):
             return
 
+        attrs = self.attributes
         device_state = self._horizon_device.get_device_state(self._device_id)
         horizon_state = device_state.get("state", "unavailable")
 
         if horizon_state == "ONLINE_RUNNING":
             if device_state.get("paused"):
-                self.attributes[Attributes.STATE] = States.PAUSED
+                attrs[Attributes.STATE] = States.PAUSED
             else:
-                self.attributes[Attributes.STATE] = States.PLAYING
+                attrs[Attributes.STATE] = States.PLAYING
             effective = self._get_effective_metadata(device_state)
         elif horizon_state == "ONLINE_STANDBY":
-            self.attributes[Attributes.STATE] = States.STANDBY
+            attrs[Attributes.STATE] = States.STANDBY
             self._last_good_metadata = {}
             effective = device_state
         elif horizon_state == "OFFLINE":
-            self.attributes[Attributes.STATE] = States.OFF
+            attrs[Attributes.STATE] = States.OFF
             self._last_good_metadata = {}
             effective = device_state
         else:
-            self.attributes[Attributes.STATE] = States.UNAVAILABLE
+            attrs[Attributes.STATE] = States.UNAVAILABLE
             effective = device_state
 
         channel_name = effective.get("channel", "")
         program_title = effective.get("media_title", "")
 
         if program_title:
-            self.attributes[Attributes.MEDIA_TITLE] = program_title
-            self.attributes[Attributes.MEDIA_ARTIST] = channel_name
+            attrs[Attributes.MEDIA_TITLE] = program_title
+            attrs[Attributes.MEDIA_ARTIST] = channel_name
         elif channel_name:
-            self.attributes[Attributes.MEDIA_TITLE] = channel_name
-            self.attributes[Attributes.MEDIA_ARTIST] = ""
+            attrs[Attributes.MEDIA_TITLE] = channel_name
+            attrs[Attributes.MEDIA_ARTIST] = ""
         else:
-            self.attributes[Attributes.MEDIA_TITLE] = ""
-            self.attributes[Attributes.MEDIA_ARTIST] = ""
+            attrs[Attributes.MEDIA_TITLE] = ""
+            attrs[Attributes.MEDIA_ARTIST] = ""
 
         media_image = effective.get("media_image", "")
         if media_image:
-            self.attributes[Attributes.MEDIA_IMAGE_URL] = self._make_unique_image_url(
-                media_image
-            )
+            attrs[Attributes.MEDIA_IMAGE_URL] = self._make_unique_image_url(media_image)
         elif self._pending_channel:
-            self.attributes[Attributes.MEDIA_IMAGE_URL] = ""
+            attrs[Attributes.MEDIA_IMAGE_URL] = ""
 
-        self.attributes[Attributes.SOURCE] = channel_name
+        attrs[Attributes.SOURCE] = channel_name
 
         start_time = effective.get("start_time")
         end_time = effective.get("end_time")
@@ -451,11 +465,18 @@ class HorizonMediaPlayer(MediaPlayer):
             pos, dur = self._horizon_device.calculate_position_duration(
                 start_time, end_time
             )
-            self.attributes[Attributes.MEDIA_POSITION] = pos
-            self.attributes[Attributes.MEDIA_DURATION] = dur
+            attrs[Attributes.MEDIA_POSITION] = pos
+            attrs[Attributes.MEDIA_DURATION] = dur
         else:
-            self.attributes[Attributes.MEDIA_POSITION] = 0
-            self.attributes[Attributes.MEDIA_DURATION] = 0
+            attrs[Attributes.MEDIA_POSITION] = 0
+            attrs[Attributes.MEDIA_DURATION] = 0
+
+        # Device callbacks land here too; when playback starts or stops the
+        # refresh loop has to re-pick its interval instead of finishing its wait
+        polling_position = attrs[Attributes.STATE] in (States.PLAYING, States.PAUSED)
+        if polling_position != self._polling_position:
+            self._polling_position = polling_position
+            self._refresh_wake.set()
 
         if not self._sources_loaded and self._horizon_device.channels_loaded:
             await self._load_sources()
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any, TYPE_CHECKING
 
 from ucapi import Remote, StatusCodes
@@ -25,6 +26,7 @@ from ucapi.ui import (
 from uc_intg_horizon.const import (
     CHANNEL_UPDATE_DELAY,
     KEY_MAP,
+    KEY_PUSH_DELAY,
     POWER_COMMAND_DELAY,
     SIMPLE_COMMANDS,
 )
@@ -36,6 +38,12 @@ if TYPE_CHECKING:
 
 _LOG = logging.getLogger(__name__)
 
+_REMOTE_STATES = {
+    "ONLINE_RUNNING": States.ON,
+    "ONLINE_STANDBY": States.OFF,
+    "OFFLINE": States.OFF,
+}
+
 BUTTON_MAPPING = [
     create_btn_mapping(Buttons.HOME, short="HOME"),
     create_btn_mapping(Buttons.BACK, short="BACK"),
@@ -138,6 +146,8 @@ class HorizonRemote(Remote):
         self._api = api
         self._media_player = media_player
         self._channel_update_task: asyncio.Task | None = None
+        self._push_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
         self._last_sent_state: States | None = None
 
         super().__init__(
@@ -156,19 +166,30 @@ class HorizonRemote(Remote):
             cmd_handler=self._handle_command,
         )
 
-        asyncio.create_task(self._periodic_refresh())
+        self._start_task(self._periodic_refresh())
+
+    def _start_task(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def close(self) -> None:
+        for task in (*self._tasks, self._channel_update_task, self._push_task):
+            if task and not task.done():
+                task.cancel()
 
     async def _periodic_refresh(self) -> None:
         from uc_intg_horizon.const import PERIODIC_REFRESH_INTERVAL
-        await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
+        # Entities are created back to back; spread their ticks over the interval
+        await asyncio.sleep(random.uniform(0, PERIODIC_REFRESH_INTERVAL))
 
         while True:
             try:
-                if self._api and self._api.configured_entities.contains(self.id):
-                    await self.push_update()
+                # push_update() returns early for unsubscribed entities
+                await self.push_update()
                 await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
             except asyncio.CancelledError:
-                break
+                raise
             except Exception as err:
                 _LOG.error("Periodic refresh error for remote %s: %s", self._device_id, err)
                 await asyncio.sleep(PERIODIC_REFRESH_INTERVAL)
@@ -180,6 +201,8 @@ class HorizonRemote(Remote):
 
         is_power = False
         is_channel = False
+        state_changed = self._horizon_device.state_changed_event(self._device_id)
+        state_changed.clear()
 
         try:
             if cmd_id == Commands.ON:
@@ -210,18 +233,24 @@ class HorizonRemote(Remote):
                 return StatusCodes.NOT_IMPLEMENTED
 
             if is_power:
-                await asyncio.sleep(POWER_COMMAND_DELAY)
-                await self.push_update()
-            elif is_channel:
-                self._schedule_channel_update()
+                # Push as soon as the box reports back; the delay is a ceiling
+                try:
+                    await asyncio.wait_for(state_changed.wait(), timeout=POWER_COMMAND_DELAY)
+                except asyncio.TimeoutError:
+                    pass
                 await self.push_update()
             else:
-                await self.push_update()
+                if is_channel:
+                    self._schedule_channel_update()
+                self._schedule_push()
 
             return StatusCodes.OK
 
         except Exception as err:
-            _LOG.error("[%s] Command error: %s", self.id, err, exc_info=True)
+            _LOG.error(
+                "[%s] Command error: %s", self.id, err,
+                exc_info=_LOG.isEnabledFor(logging.DEBUG),
+            )
             return StatusCodes.SERVER_ERROR
 
     async def _dispatch_simple_command(self, command: str) -> tuple[bool, bool]:
@@ -271,6 +300,21 @@ class HorizonRemote(Remote):
 
         return (False, False)
 
+    def _schedule_push(self) -> None:
+        # Navigation sends key bursts; only the last press needs a state push
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+        self._push_task = asyncio.create_task(self._delayed_push())
+
+    async def _delayed_push(self) -> None:
+        try:
+            await asyncio.sleep(KEY_PUSH_DELAY)
+            await self.push_update()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            _LOG.error("Delayed push error: %s", err)
+
     def _schedule_channel_update(self) -> None:
         if self._channel_update_task and not self._channel_update_task.done():
             self._channel_update_task.cancel()
@@ -293,14 +337,8 @@ class HorizonRemote(Remote):
         device_state = self._horizon_device.get_device_state(self._device_id)
         horizon_state = device_state.get("state", "unavailable")
 
-        if horizon_state == "ONLINE_RUNNING":
-            self.attributes[Attributes.STATE] = States.ON
-        elif horizon_state in ("ONLINE_STANDBY", "OFFLINE"):
-            self.attributes[Attributes.STATE] = States.OFF
-        else:
-            self.attributes[Attributes.STATE] = States.UNAVAILABLE
-
-        new_state = self.attributes[Attributes.STATE]
+        new_state = _REMOTE_STATES.get(horizon_state, States.UNAVAILABLE)
+        self.attributes[Attributes.STATE] = new_state
         if not force and new_state == self._last_sent_state:
             return
 